@@ -1,6 +1,5 @@
 import argparse
 import json
-import pytz
 import yaml
 import boto3
 import subprocess
@@ -14,10 +13,22 @@ import shutil
 import logging
 from deepdiff import DeepDiff
 from botocore.exceptions import ClientError
-from jsonschema import validate, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from glrd.util import *
 from glrd.query import load_all_releases
 
+# Use the libyaml-backed loader and dumper if PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlSafeLoader, CSafeDumper as YamlSafeDumper
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader, SafeDumper as YamlSafeDumper
+
+class NoAliasDumper(YamlSafeDumper):
+    """YAML dumper that writes shared objects in full instead of as anchors and aliases."""
+    def ignore_aliases(self, data):
+        return True
+
 # silence boto3 logging
 boto3.set_stream_logger(name="botocore.credentials", level=logging.ERROR)
 
@@ -206,12 +217,31 @@ SCHEMAS = {
         "required": ["name", "type", "version", "lifecycle", "git"]
     }
 }
-# Availanle release types
-RELEASE_TYPES = ['next', 'stable', 'patch', 'nightly', 'dev']
+# Base date of the Garden Linux major version (days since base date)
+GARDEN_VERSION_BASE_DATE = datetime(2020, 3, 31, tzinfo=UTC)
+
+def compile_schema_validator(schema):
+    """Check a JSON schema once and return a reusable validator for it."""
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+# Validators for SCHEMAS, compiled once instead of on every release validation
+SCHEMA_VALIDATORS = {release_type: compile_schema_validator(schema) for release_type, schema in SCHEMAS.items()}
 
 # Global variable to store the path of the cloned gardenlinux repository (cached)
 repo_clone_path = None
 
+# Global variable to store the S3 client used for downloads and uploads (cached)
+s3_client_cache = None
+
+def get_s3_client():
+    """Return the S3 client for downloads and uploads, creating it on first use."""
+    global s3_client_cache
+    if s3_client_cache is None:
+        s3_client_cache = boto3.client('s3')
+    return s3_client_cache
+
 def cleanup_temp_repo():
     """Cleanup function to delete the temporary directory at the end of the script."""
     global repo_clone_path
@@ -274,30 +304,23 @@ def get_git_commit_at_time(date, time="06:00", branch="main", remote_repo="https
     global repo_clone_path
 
     # Convert the input date and time to the target timezone (UTC) and then to UTC
-    target_time = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M").astimezone(pytz.timezone('UTC'))
-    target_time_utc = target_time.astimezone(pytz.UTC).strftime('%Y-%m-%dT%H:%M:%SZ')
+    target_time = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M").astimezone(UTC)
+    target_time_utc = target_time.strftime('%Y-%m-%dT%H:%M:%SZ')
 
     # If the repository hasn't been cloned yet, clone it to a dynamically created temp directory
     if not repo_clone_path:
         # Create a temporary directory for cloning the repository
         temp_dir = tempfile.mkdtemp(prefix="glrd_temp_repo_")
 
-        # Perform the shallow clone
-        clone_command = ["git", "clone", "--depth", "1", "--branch", branch, remote_repo, temp_dir]
-        clone_result = subprocess.run(clone_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        # Perform a blobless clone without checkout: searching through commits by time
+        # only needs the full commit history, not the file contents
+        clone_command = ["git", "clone", "--filter=blob:none", "--no-checkout", "--single-branch", "--branch", branch, remote_repo, temp_dir]
+        clone_result = subprocess.run(clone_command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
 
         if clone_result.returncode != 0:
             logging.error(f"Error cloning remote repository: {clone_result.stderr}")
             sys.exit(ERROR_CODES["subprocess_output_error"])
 
-        # Fetch full history to enable searching through commits by time
-        fetch_command = ["git", "fetch", "--unshallow"]
-        fetch_result = subprocess.run(fetch_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=temp_dir)
-
-        if fetch_result.returncode != 0:
-            logging.error(f"Error fetching full history from remote repository: {fetch_result.stderr}")
-            sys.exit(ERROR_CODES["subprocess_output_error"])
-
         # Cache the clone path to reuse it later
         repo_clone_path = temp_dir
 
@@ -329,8 +352,7 @@ def get_garden_version_for_date(release_type, date, existing_releases):
     Minor: Next available minor version based on existing releases.
     """
     # Calculate major version
-    base_date = datetime(2020, 3, 31, tzinfo=pytz.UTC)
-    major = (date - base_date).days
+    major = (date - GARDEN_VERSION_BASE_DATE).days
 
     if release_type == 'next':
         minor = 0
@@ -344,7 +366,7 @@ def get_garden_version_for_date(release_type, date, existing_releases):
             if release['type'] == release_type and release['version']['major'] == major
         ]
 
-        logging.debug(f"Existing minor versions for major {major}: {existing_minor_versions}")
+        logging.debug("Existing minor versions for major %s: %s", major, existing_minor_versions)
 
         if existing_minor_versions:
             minor = max(existing_minor_versions) + 1
@@ -361,7 +383,12 @@ def create_initial_releases(releases):
     release_data_patch = []
     latest_minor_versions = {}
 
-    releases.sort(key=lambda r: extract_version_data(r['tag_name']))
+    def tag_sort_key(release):
+        major, minor = extract_version_data(release['tag_name'])
+        # Unparsable tags sort first, major-only tags before their major.minor tags
+        return (-1 if major is None else major, -1 if minor is None else minor)
+
+    releases.sort(key=tag_sort_key)
 
     for release in releases:
         tag_name = release.get('tag_name')
@@ -405,7 +432,7 @@ def create_initial_releases(releases):
                 release_data_patch.append(release_info)
                 logging.debug(f"Initial patch release '{release_info['name']}' created.")
 
-        if major not in latest_minor_versions or (minor is not None and minor > latest_minor_versions[major]['minor']):
+        if major not in latest_minor_versions or (minor is not None and (latest_minor_versions[major]['minor'] is None or minor > latest_minor_versions[major]['minor'])):
             latest_minor_versions[major] = {
                 'index': len(release_data_patch if release_type == "patch" else release_data_stable) - 1,
                 'minor': minor
@@ -419,21 +446,20 @@ def create_initial_nightly_releases(stable_releases):
     release_type = "nightly"
 
     # Set the default start date to 2020-06-09 06:00 UTC
-    start_date_default = datetime(2020, 6, 9, 6, 0, 0, tzinfo=pytz.UTC)
+    start_date_default = datetime(2020, 6, 9, 6, 0, 0, tzinfo=UTC)
     
     if stable_releases:
         # Get the earliest stable release timestamp
         first_stable_release = min(stable_releases, key=lambda r: r['lifecycle']['released']['timestamp'])
         # Convert the timestamp to a datetime object and set the time to 06:00 UTC
-        start_date = datetime.utcfromtimestamp(first_stable_release['lifecycle']['released']['timestamp']).replace(hour=7, minute=0, second=0, tzinfo=pytz.UTC)
+        start_date = datetime.fromtimestamp(first_stable_release['lifecycle']['released']['timestamp'], UTC).replace(hour=7, minute=0, second=0)
     else:
         logging.info("No stable releases found in the generated data. Using default start date.")
         # Use the default start date if no stable releases are available
         start_date = start_date_default
 
     # Ensure current_date is set to 06:00 UTC as well
-    tz = pytz.timezone('UTC')
-    current_date = datetime.now(tz).replace(hour=6, minute=0, second=0, microsecond=0)
+    current_date = datetime.now(UTC).replace(hour=6, minute=0, second=0, microsecond=0)
 
     date = start_date
 
@@ -461,20 +487,19 @@ def create_single_release(release_type, args, existing_releases):
     # Check if a manual lifecycle-released-isodatetime is provided, otherwise use the current date
     if args.lifecycle_released_isodatetime:
         try:
-            release_date = datetime.strptime(args.lifecycle_released_isodatetime, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=pytz.UTC)
+            release_date = datetime.strptime(args.lifecycle_released_isodatetime, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=UTC)
         except ValueError:
             logging.error("Error: Invalid --date-time-release format. Use ISO format: YYYY-MM-DDTHH:MM:SS")
             sys.exit(ERROR_CODES["validation_error"])
     else:
-        tz = pytz.timezone('UTC')
-        release_date = tz.localize(datetime.now())
+        release_date = datetime.now().replace(tzinfo=UTC)
 
     lifecycle_released_isodate = release_date.strftime('%Y-%m-%d')
     lifecycle_released_timestamp = int(release_date.timestamp())
 
     if args.lifecycle_extended_isodatetime:
         try:
-            extended_date = datetime.strptime(args.lifecycle_extended_isodatetime, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=pytz.UTC)
+            extended_date = datetime.strptime(args.lifecycle_extended_isodatetime, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=UTC)
             lifecycle_extended_isodate = extended_date.strftime('%Y-%m-%d')
             lifecycle_extended_timestamp = int(extended_date.timestamp())
         except ValueError:
@@ -494,7 +519,7 @@ def create_single_release(release_type, args, existing_releases):
 
     if args.lifecycle_eol_isodatetime:
         try:
-            eol_date = datetime.strptime(args.lifecycle_eol_isodatetime, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=pytz.UTC)
+            eol_date = datetime.strptime(args.lifecycle_eol_isodatetime, "%Y-%m-%dT%H:%M:%S").replace(tzinfo=UTC)
             lifecycle_eol_isodate = eol_date.strftime('%Y-%m-%d')
             lifecycle_eol_timestamp = int(eol_date.timestamp())
         except ValueError:
@@ -670,21 +695,34 @@ def set_latest_minor_eol_to_major(stable_releases, patch_releases):
                 next_release = minor_releases[i + 1]
                 release['lifecycle']['eol'] = next_release['lifecycle']['released']
 
+def split_releases_by_type(releases):
+    """Split releases into one list per release type (in RELEASE_TYPES order) in a single pass."""
+    releases_by_type = {release_type: [] for release_type in RELEASE_TYPES}
+    for release in releases:
+        releases_of_type = releases_by_type.get(release['type'])
+        # Releases of unknown type are dropped, like when filtering per type
+        if releases_of_type is not None:
+            releases_of_type.append(release)
+    return tuple(releases_by_type[release_type] for release_type in RELEASE_TYPES)
+
+def split_input_releases(input_data, source):
+    """Split the releases of manual input data by type, exit if there are none."""
+    merged_releases = input_data.get('releases', [])
+    if len(merged_releases) == 0:
+        logging.error(f"Error, no releases found in JSON from {source}")
+        sys.exit(ERROR_CODES["input_parameter_missing"])
+    next_releases, stable_releases, patch_releases, nightly_releases, dev_releases = split_releases_by_type(merged_releases)
+
+    logging.debug(f"Parsed releases from {source} - next: {len(next_releases)}, stable: {len(stable_releases)}, patch: {len(patch_releases)}, nightly: {len(nightly_releases)}, dev: {len(dev_releases)}")
+
+    return next_releases, stable_releases, patch_releases, nightly_releases, dev_releases
+
 def load_input(filename):
     """Load manual input from a file if it exists."""
     try:
-        input_data = yaml.safe_load(open(filename, 'r'))
-
-        merged_releases = input_data.get('releases', [])
-        if  len(merged_releases) == 0:
-            logging.error(f"Error, no releases found in JSON from file")
-            sys.exit(ERROR_CODES["input_parameter_missing"])
-        next_releases = [r for r in merged_releases if r['type'] == 'next']
-        stable_releases = [r for r in merged_releases if r['type'] == 'stable']
-        patch_releases = [r for r in merged_releases if r['type'] == 'patch']
-        nightly_releases = [r for r in merged_releases if r['type'] == 'nightly']
-        dev_releases = [r for r in merged_releases if r['type'] == 'dev']
-        return next_releases, stable_releases, patch_releases, nightly_releases, dev_releases
+        with open(filename, 'rb') as file:
+            input_data = yaml.load(file, Loader=YamlSafeLoader)
+        return split_input_releases(input_data, "file")
     except json.JSONDecodeError as e:
         logging.error(f"Error parsing JSON from file: {str(e)}")
         sys.exit(ERROR_CODES["validation_error"])
@@ -698,21 +736,9 @@ def load_input_stdin():
         stdin_data = sys.stdin.read()
         input_data = json.loads(stdin_data)
 
-        logging.debug(f"Input data from stdin: {input_data}")
-
-        merged_releases = input_data.get('releases', [])
-        if len(merged_releases) == 0:
-            logging.error(f"Error, no releases found in JSON from stdin")
-            sys.exit(ERROR_CODES["input_parameter_missing"])
-        next_releases = [r for r in merged_releases if r['type'] == 'next']
-        stable_releases = [r for r in merged_releases if r['type'] == 'stable']
-        patch_releases = [r for r in merged_releases if r['type'] == 'patch']
-        nightly_releases = [r for r in merged_releases if r['type'] == 'nightly']
-        dev_releases = [r for r in merged_releases if r['type'] == 'dev']
-
-        logging.debug(f"Parsed releases from stdin - next: {len(next_releases)}, stable: {len(stable_releases)}, patch: {len(patch_releases)}, nightly: {len(nightly_releases)}, dev: {len(dev_releases)}")
+        logging.debug("Input data from stdin: %s", input_data)
 
-        return next_releases, stable_releases, patch_releases, nightly_releases, dev_releases
+        return split_input_releases(input_data, "stdin")
     except json.JSONDecodeError as e:
         logging.error(f"Error parsing JSON from stdin: {str(e)}")
         sys.exit(ERROR_CODES["validation_error"])
@@ -722,14 +748,13 @@ def load_input_stdin():
 
 def parse_release_name(release_name):
     """Parse the release name in the format 'type-major.minor' or 'type-major'."""
-    valid_types = ['next', 'stable', 'patch', 'nightly', 'dev']
     type_and_version = release_name.split('-', 1)
     if len(type_and_version) != 2:
         logging.error("Error: Invalid release name format. Expected 'type-major.minor' or 'type-major'")
         sys.exit(ERROR_CODES["validation_error"])
     release_type = type_and_version[0]
-    if release_type not in valid_types:
-        logging.error(f"Error: Invalid release type '{release_type}'. Must be one of {', '.join(valid_types)}.")
+    if release_type not in RELEASE_TYPES:
+        logging.error(f"Error: Invalid release type '{release_type}'. Must be one of {', '.join(RELEASE_TYPES)}.")
         sys.exit(ERROR_CODES["validation_error"])
     version = type_and_version[1]
     version_parts = version.split('.')
@@ -750,22 +775,22 @@ def parse_release_name(release_name):
 
 def validate_release_data(release, errors):
     """Validate release data using the appropriate JSON schema."""
-    schema = SCHEMAS.get(release['type'])
-    if not schema:
+    validator = SCHEMA_VALIDATORS.get(release['type'])
+    if not validator:
         error_message = f"Unknown release type: {release['type']}"
         logging.error(error_message)
         errors.append(error_message)
         return False
-    try:
-        validate(instance=release, schema=schema)
+    # Report the most relevant error, like jsonschema.validate() does
+    e = best_match(validator.iter_errors(release))
+    if e is None:
         return True
-    except ValidationError as e:
-        # Construct the field path that caused the validation error
-        field_path = '.'.join([str(p) for p in e.absolute_path])
-        error_message = f"Validation error for release '{release['name']}' at '{field_path}': {e.message}"
-        logging.error(error_message)
-        errors.append(error_message)
-        return False
+    # Construct the field path that caused the validation error
+    field_path = '.'.join([str(p) for p in e.absolute_path])
+    error_message = f"Validation error for release '{release['name']}' at '{field_path}': {e.message}"
+    logging.error(error_message)
+    errors.append(error_message)
+    return False
 
 def validate_all_releases(releases):
     """Validate all releases and exit if any validation errors are found."""
@@ -819,13 +844,25 @@ def diff_releases(existing_merged_releases, merged_releases):
                         logging.info(f"{release_name} - {change_type}: {formatted_path}")
 
 def save_output_file(data, filename, format="yaml"):
-    """Save the data to a file in the specified format."""
-    with open(filename, 'w') as file:
-        if format == 'yaml':
-            yaml.dump(data, file, default_flow_style=False, sort_keys=False)
-        else:
-            # Optimize JSON by removing unnecessary spaces
-            json.dump(data, file, separators=(',', ':'), ensure_ascii=False)
+    """Save the data to a file in the specified format, unless the file already has that content."""
+    # Serialize and encode once, so the file is compared and written as a single buffer
+    if format == 'yaml':
+        content = yaml.dump(data, Dumper=NoAliasDumper, default_flow_style=False, sort_keys=False).encode('utf-8')
+    else:
+        # Optimize JSON by removing unnecessary spaces
+        content = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    # Skip rewriting the file if it is unchanged (e.g. on idempotent reruns)
+    try:
+        with open(filename, 'rb') as file:
+            if file.read() == content:
+                logging.debug(f"Output file '{filename}' is unchanged, skipping write.")
+                return
+    except FileNotFoundError:
+        pass
+
+    with open(filename, 'wb') as file:
+        file.write(content)
 
 def create_s3_bucket(bucket_name, region):
     """Create an S3 bucket in a specified region."""
@@ -892,7 +929,7 @@ def create_s3_bucket(bucket_name, region):
 
 def upload_to_s3(file_path, bucket_name, bucket_key):
     """Upload a file to an S3 bucket."""
-    s3_client = boto3.client('s3')
+    s3_client = get_s3_client()
     try:
         s3_client.upload_file(file_path, bucket_name, bucket_key)
         logging.debug(f"Uploaded '{file_path}' to 's3://{bucket_name}/{bucket_key}'.")
@@ -902,7 +939,7 @@ def upload_to_s3(file_path, bucket_name, bucket_key):
 
 def download_from_s3(bucket_name, bucket_key, local_file):
     """Download a file from an S3 bucket to a local file."""
-    s3_client = boto3.client('s3')
+    s3_client = get_s3_client()
     try:
         s3_client.download_file(bucket_name, bucket_key, local_file)
         logging.debug(f"Downloaded 's3://{bucket_name}/{bucket_key}' to '{local_file}'.")
@@ -1050,13 +1087,6 @@ def handle_releases(args):
     # Validate all releases
     validate_all_releases(merged_releases)
 
-    # split all releases again
-    next_releases = [r for r in merged_releases if r['type'] == 'next']
-    stable_releases = [r for r in merged_releases if r['type'] == 'stable']
-    patch_releases = [r for r in merged_releases if r['type'] == 'patch']
-    nightly_releases = [r for r in merged_releases if r['type'] == 'nightly']
-    dev_releases = [r for r in merged_releases if r['type'] == 'dev']
-
     diff_releases(existing_merged_releases, merged_releases)
 
     store_releases(args, merged_releases)
@@ -1070,8 +1100,7 @@ def store_releases(args, merged_releases):
 
 def handle_splitted_output(args, bucket_name, bucket_prefix, releases):
     """Handle output of splitted releases (next, stable, patch, nightly, dev) to disk and S3."""
-    for release_type in RELEASE_TYPES:
-        releases_filtered = [r for r in releases if r['type'] == release_type]
+    for release_type, releases_filtered in zip(RELEASE_TYPES, split_releases_by_type(releases)):
         if releases_filtered:
             output_file = f"{args.output_file_prefix}-{release_type}.{args.output_format}"
             save_output_file({'releases': releases_filtered}, filename=output_file, format=args.output_format)
@@ -2,11 +2,11 @@ import argparse
 import json
 import requests
 from datetime import datetime
-import os
-import yaml
-import tabulate
 from glrd.util import *
 
+# Shared HTTP session, so that split release files are fetched over a kept-alive connection
+http_session = requests.Session()
+
 def get_version_string(version, release_type=None):
     """Return a version string from a version object. Show major only for stable and next releases."""
     if release_type in ['stable', 'next']:
@@ -56,26 +56,32 @@ def format_output(args, releases, output_format, fields=None, include_extended=F
     """Format release data for output."""
     all_fields = ["Name", "Version", "Type", "Git Commit", "Release date", "Release time", "Extended maintenance", "End of maintenance"]
     selected_fields = fields.split(',') if fields else all_fields
-    rows = [
-        [
+    rows = []
+    for r in releases:
+        # Look up the nested fields once per release
+        release_type = r.get('type', 'N/A')
+        lifecycle = r['lifecycle']
+        released = lifecycle['released']
+        rows.append([
             r.get('name', 'N/A'),
-            get_version_string(r['version'], r.get('type')),
-            r.get('type', 'N/A'),
+            get_version_string(r['version'], release_type),
+            release_type,
             r.get('git', {}).get('commit_short', 'N/A'),
-            r['lifecycle']['released'].get('isodate', 'N/A'),
-            timestamp_to_isotime(r['lifecycle']['released'].get('timestamp')),
+            released.get('isodate', 'N/A'),
+            timestamp_to_isotime(released.get('timestamp')),
             get_extended_maintenance(r),
-            r['lifecycle'].get('eol', {}).get('isodate', 'N/A')
-        ]
-        for r in releases
-    ]
+            lifecycle.get('eol', {}).get('isodate', 'N/A')
+        ])
     headers, rows = filter_fields(all_fields, rows, selected_fields)
     
     if output_format == 'json':
         print(json.dumps({"releases": releases}, indent=2))
     elif output_format == 'yaml':
+        # yaml and tabulate are only imported when needed, to keep the default shell output fast to start
+        import yaml
         print(yaml.dump({"releases": releases}, default_flow_style=False, sort_keys=False))
     elif output_format == 'markdown':
+        import tabulate
         print(tabulate.tabulate(rows, headers, tablefmt="pipe"))
     elif output_format == 'mermaid_gantt':
         format_mermaid_gantt(args, releases)
@@ -96,6 +102,15 @@ def duration_in_months(start_date, end_date):
     months = delta.days / 30.44  # Approximate average days in a month
     return round(months)
 
+def isodate_to_datetime(isodate):
+    """Convert an ISO date to a naive datetime object."""
+    try:
+        # fromisoformat is much cheaper than strptime, but needs zero-padded fields
+        return datetime.fromisoformat(isodate)
+    except ValueError:
+        # Fall back to strptime for dates without zero padding, e.g. from hand-edited input files
+        return datetime.strptime(isodate, '%Y-%m-%d')
+
 def format_mermaid_gantt(args, releases):
     """Format release data into Mermaid Gantt chart syntax."""
     print("gantt")
@@ -113,10 +128,9 @@ def format_mermaid_gantt(args, releases):
         eol_date_str = release['lifecycle'].get('eol', {}).get('isodate')  # End of life
         
         # Convert dates to datetime objects
-        date_format = '%Y-%m-%d'
-        released_date = datetime.strptime(released_date_str, date_format) if released_date_str else None
-        extended_date = datetime.strptime(extended_date_str, date_format) if extended_date_str else None
-        eol_date = datetime.strptime(eol_date_str, date_format) if eol_date_str else None
+        released_date = isodate_to_datetime(released_date_str) if released_date_str else None
+        extended_date = isodate_to_datetime(extended_date_str) if extended_date_str else None
+        eol_date = isodate_to_datetime(eol_date_str) if eol_date_str else None
         
         # Add 'Release' milestone
         if released_date:
@@ -194,56 +208,35 @@ def load_releases(input_source, is_url=False):
     """Load the releases from a file or a URL."""
     if is_url:
         try:
-            response = requests.get(input_source)
+            response = http_session.get(input_source)
             response.raise_for_status()
             return response.json()
         except requests.RequestException as e:
             print(f"Error fetching data from URL: {e}")
             exit(1)
     else:
-        if not os.path.exists(input_source):
+        try:
+            with open(input_source, 'r') as file:
+                return json.load(file)
+        except FileNotFoundError:
             print(f"Error: File {input_source} does not exist.")
             exit(1)
-        with open(input_source, 'r') as file:
-            return json.load(file)
 
 def load_split_releases(release_type, input_type, input_url, input_file_prefix, input_format):
     """Load and split releases based on type."""
-    releases_next, releases_stable, releases_patch, releases_nightly, releases_dev = [], [], [], [], []
+    releases = []
     types = release_type.split(',')
     is_url = (input_type == 'url')
 
-    if 'next' in types:
-        input_file = input_file_prefix + '-next' + '.' + input_format
-        if is_url:
-            input_file = input_url + '/' + input_file
-        releases_next = load_releases(input_file, is_url=is_url).get('releases', [])
-    
-    if 'stable' in types:
-        input_file = input_file_prefix + '-stable' + '.' + input_format
-        if is_url:
-            input_file = input_url + '/' + input_file
-        releases_stable = load_releases(input_file, is_url=is_url).get('releases', [])
-    
-    if 'patch' in types:
-        input_file = input_file_prefix + '-patch' + '.' + input_format
-        if is_url:
-            input_file = input_url + '/' + input_file
-        releases_patch = load_releases(input_file, is_url=is_url).get('releases', [])
-    
-    if 'nightly' in types:
-        input_file = input_file_prefix + '-nightly' + '.' + input_format
-        if is_url:
-            input_file = input_url + '/' + input_file
-        releases_nightly = load_releases(input_file, is_url=is_url).get('releases', [])
-    
-    if 'dev' in types:
-        input_file = input_file_prefix + '-dev' + '.' + input_format
-        if is_url:
-            input_file = input_url + '/' + input_file
-        releases_dev = load_releases(input_file, is_url=is_url).get('releases', [])
+    # Load the input file of each requested type, in RELEASE_TYPES order
+    for split_type in RELEASE_TYPES:
+        if split_type in types:
+            input_file = input_file_prefix + '-' + split_type + '.' + input_format
+            if is_url:
+                input_file = input_url + '/' + input_file
+            releases += load_releases(input_file, is_url=is_url).get('releases', [])
 
-    return releases_next + releases_stable + releases_patch + releases_nightly + releases_dev
+    return releases
 
 # def load_all_releases(args):
 def load_all_releases(release_type, input_type, input_url, input_file_prefix, input_format, no_input_split=False):
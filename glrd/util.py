@@ -2,10 +2,14 @@ import os
 import re
 import signal
 import sys
-import pytz
-from datetime import datetime
+from datetime import datetime, timezone
+from types import MappingProxyType
 
-DEFAULTS = {
+# Cached UTC tzinfo used by the date and time conversion helpers
+UTC = timezone.utc
+
+# Read-only, so the defaults cannot be changed by accident at runtime
+DEFAULTS = MappingProxyType({
     'DEFAULT_QUERY_INPUT_FORMAT': 'json',
     'DEFAULT_QUERY_INPUT_FILE_PREFIX': 'releases',
     'DEFAULT_QUERY_INPUT_TYPE': 'url',
@@ -19,7 +23,10 @@ DEFAULTS = {
     'DEFAULT_S3_BUCKET_NAME': 'gardenlinux-glrd',
     'DEFAULT_S3_BUCKET_PREFIX': '',
     'DEFAULT_S3_BUCKET_REGION': 'eu-central-1'
-}
+})
+
+# Available release types
+RELEASE_TYPES = ('next', 'stable', 'patch', 'nightly', 'dev')
 
 # Definition of error codes
 ERROR_CODES = {
@@ -35,42 +42,60 @@ ERROR_CODES = {
     "query_error": 201,
 }
 
+# Version tags are either 'major' or 'major.minor'
+VERSION_REGEX = re.compile(r'^(\d+)\.?(\d+)?$')
+
 def extract_version_data(tag_name):
     """Extract major and minor version numbers from a tag."""
-    version_regex = re.compile(r'^(\d+)\.?(\d+)?$')
-    match = version_regex.match(tag_name)
-    return (int(match.group(1)), int(match.group(2))) if match else (None, None)
+    # Fast path for plain 'major' and 'major.minor' tags, without the regex engine
+    major, _, minor = tag_name.partition('.')
+    if major.isdecimal() and (not minor or minor.isdecimal()):
+        return int(major), int(minor) if minor else None
+    match = VERSION_REGEX.match(tag_name)
+    if not match:
+        return None, None
+    minor = match.group(2)
+    return int(match.group(1)), int(minor) if minor is not None else None
 
 def get_current_timestamp():
     """Return the current timestamp."""
     return int(datetime.now().timestamp())
 
-def timestamp_to_isotime(timestamp):
-    """Convert timestamp to ISO time."""
-    dt = datetime.utcfromtimestamp(float(timestamp))
-    return dt.strftime("%H:%M:%S")
-
 def isodate_to_timestamp(isodate):
     """
     Convert an ISO 8601 formatted date (with or without time) to a Unix timestamp.
     If only a date is provided, assume the time is 00:00:00 UTC.
     """
-    try:
-        # Try parsing with full ISO format (date and time with 'Z' timezone)
-        return int(datetime.strptime(isodate, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=pytz.UTC).timestamp())
-    except ValueError:
-        # If the time part is missing, assume time is 00:00:00 UTC
-        return int(datetime.strptime(isodate, "%Y-%m-%d").replace(tzinfo=pytz.UTC).timestamp())
+    # Fast path for the zero-padded layouts, slicing the fields instead of using strptime
+    # strptime only accepts ASCII digits, so str.isdecimal() alone is too lenient
+    year, month, day = isodate[0:4], isodate[5:7], isodate[8:10]
+    date_digits = year + month + day
+    if len(isodate) in (10, 20) and isodate[4] == isodate[7] == '-' and date_digits.isascii() and date_digits.isdecimal():
+        if len(isodate) == 10:
+            # If the time part is missing, assume time is 00:00:00 UTC
+            return int(datetime(int(year), int(month), int(day), tzinfo=UTC).timestamp())
+        hour, minute, second = isodate[11:13], isodate[14:16], isodate[17:19]
+        time_digits = hour + minute + second
+        if isodate[10] == 'T' and isodate[13] == isodate[16] == ':' and isodate[19] == 'Z' and time_digits.isascii() and time_digits.isdecimal():
+            # Full ISO format (date and time with 'Z' timezone)
+            return int(datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), tzinfo=UTC).timestamp())
+    # Anything else (e.g. dates without zero padding) is parsed by strptime, picking the format by
+    # the date/time separator instead of trying one and catching the ValueError (strptime ignores case)
+    if 't' in isodate.lower():
+        # Full ISO format (date and time with 'Z' timezone)
+        return int(datetime.strptime(isodate, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=UTC).timestamp())
+    # If the time part is missing, assume time is 00:00:00 UTC
+    return int(datetime.strptime(isodate, "%Y-%m-%d").replace(tzinfo=UTC).timestamp())
 
 def timestamp_to_isodate(timestamp):
     """Convert timestamp to ISO date."""
-    dt = datetime.utcfromtimestamp(timestamp)
-    return dt.strftime("%Y-%m-%d")
+    dt = datetime.fromtimestamp(timestamp, UTC)
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
 
 def timestamp_to_isotime(timestamp):
     """Convert timestamp to ISO time."""
-    dt = datetime.utcfromtimestamp(timestamp)
-    return dt.strftime("%H:%M:%S")
+    dt = datetime.fromtimestamp(timestamp, UTC)
+    return f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
 
 # Handle SIGPIPE and BrokenPipeError
 def handle_broken_pipe_error(signum, frame):